@@ -7,6 +7,22 @@ import pygame
 class Entity(abc.ABC):
     """This class represents an entity. Entities are created each time a map is loaded."""
 
+    __slots__ = (
+        '_level',
+        '_pos',
+        '_size',
+        '_next_tile',
+        '_queued_direction',
+        '_remaining_distance',
+        '_direction',
+        '_speed',
+        '_anim_frames',
+        '_frames',
+        '_idle_frames',
+        '_animation_index',
+        '_animation_timer',
+    )
+
     EPS = 1e-5
 
     DIRECTIONS = (
@@ -49,7 +65,7 @@ class Entity(abc.ABC):
             self._idle_frames.append(tm.get_sprite(line_start_index, sprite_sheet))
 
         self._animation_index = 0
-        self._animation_timer = time.time()
+        self._animation_timer: float | None = None
 
     @property
     def position(self) -> pygame.Vector2:
@@ -84,21 +100,28 @@ class Entity(abc.ABC):
         self._speed = max(min(value, 1), 0.001)
 
     def update(self):
-        self._move()
-        if self.is_moving():
+        if self._next_tile is None:  # Idle, nothing to update
+            return
+        if self._move():
             current_time = time.time()
-            diff = current_time - self._animation_timer
-            if diff >= self.ANIMATION_COEF / self._speed:
+            if self._animation_timer is None:  # Movement just started
+                self._animation_timer = current_time
+            elif current_time - self._animation_timer >= self.ANIMATION_COEF / self._speed:
                 self._animation_index = (self._animation_index + 1) % self._anim_frames
                 self._animation_timer = current_time
+        else:
+            # Movement just stopped, next move should start on the first frame
+            self._animation_index = 0
+            self._animation_timer = None
 
-    def _move(self):
-        if self._next_tile is None:
-            return
+    def _move(self) -> bool:
+        """Move this entity towards its next tile.
 
+        :return: True if this entity is still moving, false otherwise.
+        """
         if self._remaining_distance < self.EPS:
             self._pos = self._next_tile
-            interaction = self._level.get_tile_interaction(int(self.tile_position.x), int(self.tile_position.y))
+            interaction = self._level.get_tile_interaction(int(self._pos.x), int(self._pos.y))
             interaction.on_entity_inside(self._level, self)
             self._next_tile = None
             if self._queued_direction is not None:
@@ -107,18 +130,12 @@ class Entity(abc.ABC):
             else:
                 self._remaining_distance = 0
 
-        if self.is_moving():
-            speed = pygame.Vector2()
-            if self._next_tile.x < self._pos.x:
-                speed.x = -self._speed
-            elif self._next_tile.x > self._pos.x:
-                speed.x = self._speed
-            if self._next_tile.y < self._pos.y:
-                speed.y = -self._speed
-            elif self._next_tile.y > self._pos.y:
-                speed.y = self._speed
-            self._remaining_distance -= speed.length()
-            self._pos += speed
+        if self._next_tile is None:
+            return False
+        # Next tile is always one step away in the current direction
+        self._pos += self.DIRECTIONS[self._direction] * self._speed
+        self._remaining_distance -= self._speed
+        return True
 
     def go_up(self):
         self._move_to_next_tile(3)
@@ -141,13 +158,13 @@ class Entity(abc.ABC):
                 self._queued_direction = d
             return
         self._direction = d
-        direction = self.DIRECTIONS[d]
-        pos = self.tile_position + direction
+        tile_pos = self.tile_position
+        pos = tile_pos + self.DIRECTIONS[d]
         interaction = self._level.get_tile_interaction(int(pos.x), int(pos.y))
         if interaction.can_entity_go_through(self._level, self):
             interaction.on_entity_enter(self._level, self)
             self._next_tile = pos
-            self._remaining_distance = self._next_tile.distance_to(self.tile_position)
+            self._remaining_distance = pos.distance_to(tile_pos)
 
     def get_texture(self) -> pygame.Surface:
         if self.is_moving():
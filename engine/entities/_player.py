@@ -4,6 +4,8 @@ from . import _entity
 class PlayerEntity(_entity.Entity):
     """This class represents the player entity. The player is created each time a map is loaded."""
 
+    __slots__ = ('sprint_ratio', '_base_speed', '_is_running')
+
     def __init__(self, sprite_sheet: str, level, sprint_ratio: float):
         """Create a player entity.
 
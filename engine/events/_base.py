@@ -6,6 +6,8 @@ import pygame
 class Event:
     """Base class for events."""
 
+    __slots__ = ('_next_event',)
+
     def __init__(self):
         """Create an event with no next event."""
         self._next_event: Event | None = None
@@ -26,6 +28,8 @@ class Event:
 
 
 class GoToScreenEvent(Event):
+    __slots__ = ('screen',)
+
     def __init__(self, screen):
         """Create an event to load the given screen.
 
@@ -37,6 +41,8 @@ class GoToScreenEvent(Event):
 
 
 class ChangeLevelEvent(Event):
+    __slots__ = ('level_name', 'spawn_location')
+
     def __init__(self, level_name: str, spawn_location: pygame.Vector2):
         """Create an event to load the specified level.
 
@@ -49,6 +55,8 @@ class ChangeLevelEvent(Event):
 
 
 class SpawnEntityEvent(Event):
+    __slots__ = ('entity_supplier', 'at')
+
     def __init__(self, entity_supplier, at: pygame.Vector2):
         """Create an event to spawn an entity in the current level.
 
@@ -72,6 +80,8 @@ class SpawnEntityEvent(Event):
 
 
 class DisplayDialogEvent(Event):
+    __slots__ = ('text_key', 'kwargs')
+
     def __init__(self, text_key: str, **kwargs):
         """Create an event to show a dialog.
 
@@ -84,6 +94,8 @@ class DisplayDialogEvent(Event):
 
 
 class ToggleSceneUpdateEvent(Event):
+    __slots__ = ('should_update',)
+
     def __init__(self, should_update: bool):
         """Create an event that changes whether scenes should be updated.
 
@@ -94,6 +106,8 @@ class ToggleSceneUpdateEvent(Event):
 
 
 class WaitEvent(Event):
+    __slots__ = ('milliseconds',)
+
     def __init__(self, milliseconds: int):
         """Create an event to force the engine to wait for a given amount of time before handling any other event.
 
@@ -105,7 +119,8 @@ class WaitEvent(Event):
 
 class QuitGameEvent(Event):
     """This event quits the game by stopping the game engine."""
-    pass
+
+    __slots__ = ()
 
 
 __all__ = [
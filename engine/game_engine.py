@@ -1,15 +1,16 @@
 import argparse
+import collections
 import dataclasses
 import datetime
 import logging
 import pathlib
 import sys
-import time
 import traceback
+import typing as _typ
 
 import pygame
 
-from . import config, constants, errors, events, level, maths, render, scene as scene_
+from . import config, constants, errors, events, io, level, render, scene as scene_
 from .screens import screens, hud
 
 
@@ -43,7 +44,11 @@ class GameEngine:
     NAME = 'RPG Engine'
     VERSION = '1.0'
 
-    FPS = 60
+    FPS = 60  # Maximum number of rendered frames per second
+    UPS = 60  # Number of game updates per second
+    MAX_UPDATES_PER_FRAME = 5  # Maximum number of late updates to catch up on before rendering
+    FRAME_SPIN_MS = 2  # Last milliseconds of each frame that are busy-waited rather than slept
+    FRAME_TIME_TOLERANCE_MS = 2  # Frames lasting this close to an update step run exactly one update
 
     def __init__(self, args: _CLIArgs):
         self._logger = logging.getLogger(self.__class__.__qualname__)
@@ -53,6 +58,18 @@ class GameEngine:
         self._window = pygame.display.set_mode(self._config.base_screen_size, pygame.RESIZABLE)
         self._screen = pygame.Surface(self._config.base_screen_size)
         pygame.display.set_caption(self._config.game_title)
+        # Let SDL drop high-frequency events that are never handled instead of queueing them
+        pygame.event.set_blocked([
+            pygame.MOUSEMOTION,
+            pygame.MOUSEWHEEL,
+            pygame.ACTIVEEVENT,
+            pygame.TEXTEDITING,
+            pygame.TEXTINPUT,
+            pygame.JOYAXISMOTION,
+            pygame.JOYBALLMOTION,
+            pygame.JOYHATMOTION,
+            pygame.FINGERMOTION,
+        ])
 
         if self._config.debug:
             logging_level = logging.DEBUG
@@ -69,7 +86,17 @@ class GameEngine:
         self._level_loader = level.LevelLoader(self)
         self._active_scene: scene_.Scene | None = None
         self._scene_transition: _SceneTransition | None = None
-        self._events_queue = []
+        self._events_queue: collections.deque[events.Event] = collections.deque()
+        # Dispatch on the event type instead of trying each match case in turn
+        self._event_handlers: dict[type[events.Event], _typ.Callable[[_typ.Any], None]] = {
+            events.ToggleSceneUpdateEvent: self._on_toggle_scene_update,
+            events.ChangeLevelEvent: self._on_change_level,
+            events.GoToScreenEvent: self._on_go_to_screen,
+            events.SpawnEntityEvent: self._on_spawn_entity,
+            events.DisplayDialogEvent: self._on_display_dialog,
+            events.WaitEvent: self._on_wait,
+            events.QuitGameEvent: self._on_quit_game,
+        }
         self._event_wait_delay = 0
         self._event_wait_start_time = 0
         self._update_scene = True
@@ -134,6 +161,13 @@ class GameEngine:
 
         pygame.key.set_repeat(300, 150)
         self._running = True
+        update_delay = 1000 / self.UPS
+        max_lag = update_delay * self.MAX_UPDATES_PER_FRAME
+        lag = update_delay  # Update once before rendering the first frame
+        previous_time = pygame.time.get_ticks()
+        frame_delay = 1000 / self.FPS
+        next_frame_time = previous_time + frame_delay
+        frame_time = previous_time  # Time at which the current frame started
         while self._running:
             if not self._active_scene:
                 raise errors.NoSceneError()
@@ -142,29 +176,25 @@ class GameEngine:
                 if event.type == pygame.QUIT:
                     self._stop()
                     break
+                io.on_input_event(event)
                 if event.type == pygame.KEYDOWN and event.key == pygame.K_F3 and self._config.debug:
                     self._show_debug_info = not self._show_debug_info
                 if self._update_scene and not self._scene_transition:
                     self._active_scene.on_input_event(event)
 
-            if self._scene_transition:
-                self._scene_transition.update()
-                if self._scene_transition.is_done:
-                    self._scene_transition = None
-            else:
-                if self._update_scene:
-                    self._active_scene.update()
-
-                delay_expired = (self._event_wait_delay == 0
-                                 or _time_millis() - self._event_wait_start_time >= self._event_wait_delay)
-                if delay_expired and self._events_queue:
-                    if self._event_wait_delay != 0:
-                        self._event_wait_delay = 0
-                    event = self._events_queue.pop(0)
-                    self._handle_event(event)
-                    if next_event := event.next:
-                        # Insert next event at start of queue
-                        self._events_queue.insert(0, next_event)
+            # Run game logic at a fixed rate, independently of the rendering rate
+            # Measured from the end of frame pacing, before presenting, so that display jitter does not count
+            elapsed = frame_time - previous_time
+            previous_time = frame_time
+            # Absorb millisecond rounding and pacing jitter, otherwise frames paced at the update rate
+            # would regularly run either no update or two, making movement stutter
+            if abs(elapsed - update_delay) <= self.FRAME_TIME_TOLERANCE_MS:
+                elapsed = update_delay
+            # Drop updates that cannot be caught up on (e.g. after loading a level)
+            lag = min(lag + elapsed, max_lag)
+            while lag >= update_delay and self._running:
+                self._update()
+                lag -= update_delay
 
             self._active_scene.draw(self._screen)
             if self._scene_transition:
@@ -179,9 +209,39 @@ class GameEngine:
             x = (self._window.get_width() - image.get_width()) / 2
             y = (self._window.get_height() - image.get_height()) / 2
             self._window.blit(image, (x, y))
-            self._clock.tick(self.FPS)
+            # OS sleeps are too coarse for precise frame pacing: sleep through most of the remaining frame time,
+            # then only busy-wait for the last few milliseconds
+            remaining = next_frame_time - pygame.time.get_ticks() - self.FRAME_SPIN_MS
+            if remaining > 0:
+                pygame.time.wait(int(remaining))
+            while (frame_time := pygame.time.get_ticks()) < next_frame_time:
+                pass
+            # Deadlines keep their fractional part so that frames last exactly 1000 / FPS ms on average
+            next_frame_time = max(next_frame_time + frame_delay, frame_time)
+            self._clock.tick()  # Only measures the frame rate for the debug HUD
             pygame.display.flip()
 
+    def _update(self):
+        """Execute a single game update: update the active scene or transition then handle the next queued event."""
+        if self._scene_transition:
+            self._scene_transition.update()
+            if self._scene_transition.is_done:
+                self._scene_transition = None
+        else:
+            if self._update_scene:
+                self._active_scene.update()
+
+            delay_expired = (self._event_wait_delay == 0
+                             or pygame.time.get_ticks() - self._event_wait_start_time >= self._event_wait_delay)
+            if delay_expired and self._events_queue:
+                if self._event_wait_delay != 0:
+                    self._event_wait_delay = 0
+                event = self._events_queue.popleft()
+                self._handle_event(event)
+                if next_event := event.next:
+                    # Insert next event at start of queue
+                    self._events_queue.appendleft(next_event)
+
     def _scale_screen(self) -> pygame.Surface:
         r = self._config.screen_ratio
         ww, wh = self._window.get_size()
@@ -193,28 +253,45 @@ class GameEngine:
         return pygame.transform.smoothscale(self._screen, (w, h))
 
     def _handle_event(self, event: events.Event):
-        in_level = isinstance(self._active_scene, level.Level)
-        match event:
-            case events.ToggleSceneUpdateEvent(should_update=update):
-                self._update_scene = update
-            case events.ChangeLevelEvent(level_name=level_name, spawn_location=spawn_location):
-                self.load_level(level_name, spawn_location)
-            case events.GoToScreenEvent(screen=screen):
-                self.load_screen(screen)
-            case events.SpawnEntityEvent(entity_supplier=entity_supplier, at=at) if in_level:
-                # noinspection PyTypeChecker
-                lvl: level.Level = self._active_scene
-                lvl.spawn_entity(entity_supplier, at)
-            case events.DisplayDialogEvent(text_key=text_key) as e if in_level:
-                text = self._config.active_language.translate(text_key, **e.kwargs)
-                print(text)  # TODO properly display dialog
-            case events.WaitEvent(milliseconds=ms):
-                self._event_wait_delay = ms
-                self._event_wait_start_time = _time_millis()
-            case events.QuitGameEvent():
-                self._stop()
-            case e:
-                self._logger.warning(f'Unexpected event: {e}')
+        event_type = type(event)
+        if (handler := self._event_handlers.get(event_type)) is None:
+            # Subclasses are handled like their closest parent event type, cache the result for next time
+            handler = next((self._event_handlers[t] for t in event_type.__mro__ if t in self._event_handlers),
+                           self._on_unexpected_event)
+            self._event_handlers[event_type] = handler
+        handler(event)
+
+    def _on_toggle_scene_update(self, event: events.ToggleSceneUpdateEvent):
+        self._update_scene = event.should_update
+
+    def _on_change_level(self, event: events.ChangeLevelEvent):
+        self.load_level(event.level_name, event.spawn_location)
+
+    def _on_go_to_screen(self, event: events.GoToScreenEvent):
+        self.load_screen(event.screen)
+
+    def _on_spawn_entity(self, event: events.SpawnEntityEvent):
+        if not isinstance(self._active_scene, level.Level):
+            self._on_unexpected_event(event)
+            return
+        self._active_scene.spawn_entity(event.entity_supplier, event.at)
+
+    def _on_display_dialog(self, event: events.DisplayDialogEvent):
+        if not isinstance(self._active_scene, level.Level):
+            self._on_unexpected_event(event)
+            return
+        text = self._config.active_language.translate(event.text_key, **event.kwargs)
+        print(text)  # TODO properly display dialog
+
+    def _on_wait(self, event: events.WaitEvent):
+        self._event_wait_delay = event.milliseconds
+        self._event_wait_start_time = pygame.time.get_ticks()
+
+    def _on_quit_game(self, _: events.QuitGameEvent):
+        self._stop()
+
+    def _on_unexpected_event(self, event: events.Event):
+        self._logger.warning(f'Unexpected event: {event}')
 
     def load_level(self, name: str, player_spawn_location: pygame.Vector2):
         lvl = self._level_loader.load_level(name)
@@ -235,15 +312,14 @@ class GameEngine:
         self._running = False
 
 
-def _time_millis() -> int:
-    return time.time_ns() // 1_000_000
-
-
 class _SceneTransition:
     def __init__(self, engine: GameEngine, fade_out_duration: int, queued_scene: scene_.Scene):
         self._engine = engine
         self._fade_out_duration = fade_out_duration
-        self._start_time = _time_millis()
+        self._alpha_rate = 255 / fade_out_duration
+        self._start_time = pygame.time.get_ticks()
+        # Opaque black overlay, faded through its surface-wide alpha rather than per-pixel alpha
+        self._overlay = pygame.Surface(engine.window_size).convert()
         self._queued_scene = queued_scene
         self._fading_out = True
         self._done = False
@@ -255,24 +331,25 @@ class _SceneTransition:
     def update(self):
         if self._done:
             return
-        diff = _time_millis() - self._start_time
+        diff = pygame.time.get_ticks() - self._start_time
         if self._fading_out and diff >= self._fade_out_duration:
             self._fading_out = False
-            self._start_time = _time_millis()  # Reset start time for fade-in
+            self._start_time = pygame.time.get_ticks()  # Reset start time for fade-in
             # noinspection PyProtectedMember
             self._engine._set_active_scene(self._queued_scene)
         elif not self._fading_out and diff >= self._fade_out_duration:
             self._done = True
 
     def draw(self, screen: pygame.Surface):
-        diff = _time_millis() - self._start_time
-        progress = diff / self._fade_out_duration
+        alpha = int((pygame.time.get_ticks() - self._start_time) * self._alpha_rate)
+        if alpha > 255:
+            alpha = 255
+        elif alpha < 0:
+            alpha = 0
         if not self._fading_out:
-            progress = 1 - progress
-        surface = pygame.Surface(screen.get_size()).convert_alpha()
-        alpha = maths.clamp(progress * 255, 0, 255)
-        surface.fill((0, 0, 0, alpha))
-        screen.blit(surface, (0, 0))
+            alpha = 255 - alpha
+        self._overlay.set_alpha(alpha)
+        screen.blit(self._overlay, (0, 0))
 
 
 def _generate_crash_report(e: BaseException, scene: scene_.Scene = None) -> str:
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import datetime
-import re
+import os
+import typing as _typ
 
 from . import inventory, io, constants
 
@@ -20,18 +21,51 @@ def list_saves() -> list[tuple[int, datetime.datetime]]:
 
     :return: A list of all available save IDs and their date.
     """
+    if not constants.SAVES_DIR.is_dir():
+        return []
     data = []
-    for file in constants.SAVES_DIR.glob('save_*.dat'):
-        if file.is_file() and (m := re.fullmatch(r'save_(\d+)\.dat', file.name)):
-            save_id = int(m.group(1))
-            with file.open(mode='rb') as f:
-                buffer = io.ByteBuffer(f.read(30))
-            date = datetime.datetime.strptime(buffer.read_string(), '%Y-%m-%dT%H:%M:%S')
-            data.append((save_id, date))
+    # scandir() gets file types from the directory listing, no need for an extra stat() per file
+    with os.scandir(constants.SAVES_DIR) as entries:
+        for entry in entries:
+            name = entry.name
+            # Match "save_<digits>.dat"
+            if not (name.startswith('save_') and name.endswith('.dat')):
+                continue
+            digits = name[5:-4]
+            if digits.isdecimal() and entry.is_file():
+                save_id = int(digits)
+                # Save files are written all at once, their modification time is the save date
+                date = datetime.datetime.fromtimestamp(entry.stat().st_mtime).replace(microsecond=0)
+                data.append((save_id, date))
     return sorted(data, key=lambda e: e[0])
 
 
 FlagValue = bool | int | float | str
+# Tags written before flag values to identify their type when loading.
+# They are part of the save file format and must never change.
+_TAG_BOOL = 0
+_TAG_INT = 1
+_TAG_DOUBLE = 2
+_TAG_STRING = 3
+# Tag, value type, buffer writer and buffer reader of each type of flag value.
+# Types are checked in this order, bool must come before int as it is a subclass of it.
+_FLAG_TYPES: tuple[tuple[int, type, _typ.Callable[[io.ByteBuffer, _typ.Any], None],
+                         _typ.Callable[[io.ByteBuffer], FlagValue]], ...] = (
+    (_TAG_BOOL, bool, io.ByteBuffer.write_bool, io.ByteBuffer.read_bool),
+    (_TAG_INT, int, io.ByteBuffer.write_int, io.ByteBuffer.read_int),
+    (_TAG_DOUBLE, float, io.ByteBuffer.write_double, io.ByteBuffer.read_double),
+    (_TAG_STRING, str, io.ByteBuffer.write_string, io.ByteBuffer.read_string),
+)
+_FLAG_READERS: dict[int, _typ.Callable[[io.ByteBuffer], FlagValue]] = {
+    tag: reader for tag, _, _, reader in _FLAG_TYPES
+}
+
+
+def _get_flag_writer(value: FlagValue) -> tuple[int, _typ.Callable[[io.ByteBuffer, _typ.Any], None]] | None:
+    for tag, value_type, writer, _ in _FLAG_TYPES:
+        if isinstance(value, value_type):
+            return tag, writer
+    return None
 
 
 class GameState:
@@ -44,7 +78,9 @@ class GameState:
             with (constants.SAVES_DIR / f'save_{save_id}.dat').open(mode='rb') as f:
                 buffer = io.ByteBuffer(f.read())
             buffer.read_string()  # Skip date string
-            # TODO load from file
+            for _ in range(buffer.read_int(signed=False)):
+                flag_name = buffer.read_string()
+                self._flags[flag_name] = _FLAG_READERS[buffer.read_byte(signed=False)](buffer)
             self._player_inventory = inventory.PlayerInventory(buffer)
         else:
             self._player_inventory = inventory.PlayerInventory()
@@ -70,7 +106,7 @@ class GameState:
         return self._flags[name]
 
     def set_flag(self, name: str, value: FlagValue):
-        if not isinstance(value, FlagValue):
+        if _get_flag_writer(value) is None:
             t = str(FlagValue).replace(' | ', ', ')
             raise TypeError(f'expected {t}, got {type(value).__qualname__}')
         self._flags[name] = value
@@ -84,15 +120,9 @@ class GameState:
         buffer.write_int(len(self._flags), signed=False)
         for flag_name, flag_value in self._flags.items():
             buffer.write_string(flag_name)
-            match flag_value:
-                case bool(b):
-                    buffer.write_bool(b)
-                case int(i):
-                    buffer.write_int(i)
-                case float(f):
-                    buffer.write_double(f)
-                case str(s):
-                    buffer.write_string(s)
+            tag, writer = _get_flag_writer(flag_value)
+            buffer.write_byte(tag, signed=False)
+            writer(buffer, flag_value)
         self._player_inventory.save(buffer)
         with (constants.SAVES_DIR / f'save_{self._save_id}.dat').open(mode='wb') as f:
             f.write(buffer.bytes)
@@ -23,20 +23,24 @@ class Language:
     def translate(self, key: str, **kwargs) -> str:
         return self._mappings.get(key, key).format(**kwargs)
 
-    def _load_mappings(self, json_object: dict, key_prexif: str = None) -> dict[str, str]:
+    def _load_mappings(self, json_object: dict, key_prexif: str = None, pool: dict[str, str] = None) \
+            -> dict[str, str]:
+        if pool is None:
+            pool = {}  # Identical translations share a single string object
         translations = {}
         for k, v in json_object.items():
             if key_prexif:
                 k = f'{key_prexif}.{k}'
             if isinstance(v, dict):
-                translations.update(self._load_mappings(v, k))
+                translations.update(self._load_mappings(v, k, pool))
             elif isinstance(v, list):
                 for i, item in enumerate(v):
-                    translations.update(self._load_mappings(item, f'{k}.{i}'))
+                    translations.update(self._load_mappings(item, f'{k}.{i}', pool))
             elif v is None:
                 translations[k] = None
             else:
-                translations[k] = str(v)
+                v = str(v)
+                translations[k] = pool.setdefault(v, v)
         return translations
 
     def __str__(self):
@@ -13,13 +13,7 @@ class Item:
     TYPES = [TYPE_NORMAL, TYPE_EQUIP, TYPE_QUEST, ]
 
     id: int
-    type: str
-
-    def __eq__(self, other):
-        return isinstance(other, Item) and self.id == other.id
-
-    def __hash__(self):
-        return 31 ^ hash(self.id)
+    type: str = dataclasses.field(compare=False)  # Items are identified by their ID only
 
 
 class ItemStack:
@@ -55,15 +49,8 @@ class ItemStack:
             if the resulting stack size is negative or greater than the maximum.
         """
         c = self._count
-        if c + v > self.MAX_COUNT:
-            self._count = self.MAX_COUNT
-            return self.MAX_COUNT - c
-        elif c + v < 0:
-            self._count = 0
-            return -c
-        else:
-            self._count += v
-            return v
+        self._count = max(0, min(c + v, self.MAX_COUNT))
+        return self._count - c
 
     def copy(self):
         return ItemStack(self._item, self._count)
@@ -71,15 +58,12 @@ class ItemStack:
     def __eq__(self, other):
         return isinstance(other, ItemStack) and self.item == other.item and self.count == other.count
 
-    def __hash__(self):
-        return 31 ^ hash(self._item) ^ hash(self._count)
-
 
 class PlayerInventory:
     """Holds the items of the player character."""
 
     def __init__(self, buffer: io.ByteBuffer = None):
-        self._items: dict[str, set[ItemStack]] = {t: set() for t in Item.TYPES}
+        self._items: dict[str, dict[Item, ItemStack]] = {t: {} for t in Item.TYPES}
         # TODO load from buffer
 
     def add_item(self, item_stack: ItemStack):
@@ -87,26 +71,22 @@ class PlayerInventory:
             return
         stack_item = item_stack.item
         stacks = self._items[stack_item.type]
-        for stack in stacks:
-            if stack.item == stack_item:
-                diff = stack.update_count(item_stack.count)
-                item_stack.update_count(diff)
-                break
+        if stack := stacks.get(stack_item):
+            diff = stack.update_count(item_stack.count)
+            item_stack.update_count(diff)
         else:
-            stacks.add(item_stack.copy())
+            stacks[stack_item] = item_stack.copy()
 
     def remove_item(self, item_stack: ItemStack):
         if item_stack.is_empty:
             return
         stack_item = item_stack.item
         stacks = self._items[stack_item.type]
-        for stack in stacks:
-            if stack.item == stack_item:
-                diff = stack.update_count(-item_stack.count)
-                item_stack.update_count(diff)
-                if stack.is_empty:
-                    stacks.remove(stack)
-                break
+        if stack := stacks.get(stack_item):
+            diff = stack.update_count(-item_stack.count)
+            item_stack.update_count(diff)
+            if stack.is_empty:
+                del stacks[stack_item]
 
     def save(self, buffer: io.ByteBuffer):
         pass  # TODO
@@ -1,15 +1,33 @@
-import pygame.key
+import pygame
 
 from ._byte_buffer import *
 
 
+# Keys that are currently held down, maintained from the polled KEYDOWN/KEYUP events
+_pressed_keys: set[int] = set()
+
+
+def on_input_event(event: pygame.event.Event):
+    """Update the set of pressed keys from the given event.
+    Called by the game engine for every polled input event.
+
+    :param event: The event to process.
+    """
+    if event.type == pygame.KEYDOWN:
+        _pressed_keys.add(event.key)
+    elif event.type == pygame.KEYUP:
+        _pressed_keys.discard(event.key)
+    elif event.type == pygame.WINDOWFOCUSLOST:
+        # Key releases are not reported while the window is not focused
+        _pressed_keys.clear()
+
+
 def are_keys_pressed(*keys: int) -> tuple[bool, ...]:
-    states = pygame.key.get_pressed()
-    return tuple(states[key] for key in keys)
+    return tuple(key in _pressed_keys for key in keys)
 
 
 def is_any_key_pressed(*keys: int) -> bool:
-    return any(are_keys_pressed(*keys))
+    return any(key in _pressed_keys for key in keys)
 
 
 def get_key_name(key: int) -> str:
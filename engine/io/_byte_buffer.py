@@ -3,6 +3,9 @@ import typing as _typ
 
 import pygame
 
+# Precompiled big-endian structs for each number format, avoids parsing format strings on each read/write
+_STRUCTS = {f: struct.Struct('>' + f) for f in 'BbHhIiQqfd'}
+
 
 class ByteBuffer:
     """Wrapper around a bytes or bytearray object.
@@ -40,7 +43,9 @@ class ByteBuffer:
 
         :param signed: Whether the value should be interpreted as signed or unsigned.
         """
-        return self._read_number('Bb'[signed], 1)
+        if not signed:  # Indexing already yields an unsigned byte
+            return self._bytes[self._i()]
+        return self._read_number('b', 1)
 
     def read_short(self, signed: bool = True) -> int:
         """Read a short int value (2 bytes) then advance the read cursor.
@@ -49,6 +54,15 @@ class ByteBuffer:
         """
         return self._read_number('Hh'[signed], 2)
 
+    def read_shorts(self, n: int, signed: bool = True) -> tuple[int, ...]:
+        """Read n consecutive short int values (2 bytes each) then advance the read cursor.
+
+        :param n: Number of values to read.
+        :param signed: Whether the values should be interpreted as signed or unsigned.
+        :return: The values in the order they were read.
+        """
+        return struct.unpack_from(f'>{n}{"Hh"[signed]}', self._bytes, self._i(2 * n))
+
     def read_int(self, signed: bool = True) -> int:
         """Read an int value (4 bytes) then advance the read cursor.
 
@@ -72,14 +86,15 @@ class ByteBuffer:
         return self._read_number('d', 8)
 
     def _read_number(self, f: str, byte_size: int) -> int | float:
-        i = self._i(byte_size)
-        return struct.unpack('>' + f, self._bytes[i:i + byte_size])[0]
+        return _STRUCTS[f].unpack_from(self._bytes, self._i(byte_size))[0]
 
     def read_string(self) -> str:
         """Read a string value decoded as UTF-8 then advance the read cursor."""
         size = self.read_int(signed=False)
         i = self._i(size)
-        return self._bytes[i:i + size].decode('UTF-8')
+        # Decode through a view to avoid copying the string’s bytes
+        with memoryview(self._bytes) as view:
+            return str(view[i:i + size], 'UTF-8')
 
     def read_vector(self, as_ints: bool = False) -> pygame.Vector2:
         """Read a vector then advance the read cursor.
@@ -149,7 +164,7 @@ class ByteBuffer:
         self._write_number(f, 'd')
 
     def _write_number(self, v: int | float, f: str):
-        self._bytes.extend(struct.pack('>' + f, v))
+        self._bytes.extend(_STRUCTS[f].pack(v))
 
     def write_string(self, s: str):
         """Write a string value encoded as UTF-8 at the end of this buffer.
@@ -1,9 +1,7 @@
 from __future__ import annotations
 
-import dataclasses
 import gzip
 import json
-import time
 import typing as _typ
 
 import pygame
@@ -29,8 +27,8 @@ class LevelLoader:
         if name not in self._levels_data:
             raise KeyError(f'no map with name "{name}"')
 
-        with gzip.open(constants.MAPS_DIR / f'{name}.map', mode='rb') as f:
-            buffer = io.ByteBuffer(f.read())
+        # Decompress the whole file in one call instead of streaming it through GzipFile’s small read chunks
+        buffer = io.ByteBuffer(gzip.decompress((constants.MAPS_DIR / f'{name}.map').read_bytes()))
         version = buffer.read_int(signed=False)  # Future-proofing
         if version != 1:
             raise ValueError(f'unrecognized level file version {version}')
@@ -59,46 +57,66 @@ class LevelLoader:
     @staticmethod
     def _load_tiles(buffer: io.ByteBuffer, width: int, height: int) -> list[list[list[Tile]]]:
         layers_nb = buffer.read_byte(signed=False)
-        layers = []
-        for layer in range(layers_nb):
-            layers.append([])
-            for y in range(height):
-                layers[layer].append([None] * width)
-                for x in range(width):
-                    tileset_id = buffer.read_short(signed=False)
-                    tile_id = buffer.read_short(signed=False)
-                    if tileset_id > 0:
-                        layers[layer][y][x] = Tile(tileset_id, tile_id)
-        return layers
+        row_size = 2 * width
+        tiles = []
+        for _ in range(layers_nb):
+            # Read whole layers at once, each tile is a (tileset ID, tile ID) pair
+            values = buffer.read_shorts(row_size * height, signed=False)
+            rows = (values[y * row_size:(y + 1) * row_size] for y in range(height))
+            tiles.append([[Tile(tileset_id, tile_id) if tileset_id > 0 else None
+                           for tileset_id, tile_id in zip(row[::2], row[1::2])]
+                          for row in rows])
+        return tiles
 
     def _load_interactions(self, buffer: io.ByteBuffer, width: int, height: int) \
             -> list[list[inter.TileInteraction]]:
+        # Cells with identical interactions share a single instance
+        interned: dict[tuple, inter.TileInteraction] = {}
         interactions = []
-        for y in range(height):
-            interactions.append([])
+        for _ in range(height):
+            row = [inter.NO_INTERACTION] * width
             for x in range(width):
-                interactions[y].append(self._read_interaction(buffer))
+                # Most cells have no interaction, only parse the others
+                if interaction_type := buffer.read_byte(signed=False):
+                    if interaction_type in _INTERACTION_TYPES:
+                        read_args, factory = _INTERACTION_TYPES[interaction_type]
+                        key = (interaction_type, *read_args(buffer))
+                        if (interaction := interned.get(key)) is None:
+                            interaction = interned[key] = factory(*key[1:])
+                        row[x] = interaction
+            interactions.append(row)
         return interactions
 
-    @staticmethod
-    def _read_interaction(buffer: io.ByteBuffer):
-        match buffer.read_byte(signed=False):
-            case 1:
-                return inter.WALL_INTERACTION
-            case 2:
-                return inter.ChangeLevelInteraction(
-                    buffer.read_string(),
-                    buffer.read_vector(as_ints=True),
-                    buffer.read_byte(signed=False),
-                    buffer.read_bool()
-                )
-            case 3:
-                return inter.HurtEntityInteraction(buffer.read_double())
-            case _:
-                return inter.NO_INTERACTION
+
+def _read_change_level_args(buffer: io.ByteBuffer) -> tuple[str, int, int, int, bool]:
+    # Spawn location is written as a vector of ints, read its coordinates directly to get hashable values
+    return (
+        buffer.read_string(),
+        buffer.read_long(),
+        buffer.read_long(),
+        buffer.read_byte(signed=False),
+        buffer.read_bool()
+    )
+
+
+def _create_change_level(destination_map: str, x: int, y: int, state: int, hidden: bool) \
+        -> inter.ChangeLevelInteraction:
+    return inter.ChangeLevelInteraction(destination_map, pygame.Vector2(x, y), state, hidden)
+
+
+# For each interaction type tag: a function that reads the interaction’s arguments from a buffer
+# and a function that creates the interaction from those arguments. Unknown tags are read as no interaction.
+_INTERACTION_TYPES: dict[int, tuple[_typ.Callable[[io.ByteBuffer], tuple],
+                                    _typ.Callable[..., inter.TileInteraction]]] = {
+    1: (lambda _: (), lambda: inter.WALL_INTERACTION),
+    2: (_read_change_level_args, _create_change_level),
+    3: (lambda buffer: (buffer.read_double(),), inter.HurtEntityInteraction),
+}
 
 
 class Level(scene.Scene):
+    CHUNK_SIZE = 8  # Size in tiles of the square chunks that tile layers are pre-rendered into
+
     def __init__(self,
                  game_engine,
                  name: str,
@@ -132,10 +150,21 @@ class Level(scene.Scene):
         self._interactions = interactions
         self._entity_layer = entity_layer
         self._background_color = bg_color
-        self._camera_pos = pygame.Vector2()
+        # Position of the screen’s top-left corner, in pixels relative to the level’s top-left corner
+        self._camera_x = 0.0
+        self._camera_y = 0.0
+
+        # Tiles never change, pre-render them by chunks instead of redrawing each tile every frame.
+        # Only chunks around the screen are kept, pre-rendering the whole map at once would take
+        # two map-sized surfaces (about 160 MB each for a 100×100 map).
+        self._bottom_layers = range(0, min(entity_layer + 1, len(tiles)))
+        self._top_layers = range(entity_layer + 1, len(tiles))
+        # Pre-rendered (bottom layers, top layers) surfaces, keyed by chunk coordinates
+        self._chunks: dict[tuple[int, int], tuple[pygame.Surface, pygame.Surface | None]] = {}
 
         self._player: entities.PlayerEntity | None = None
-        self._entities: set[entities.Entity] = set()
+        self._entity_set: set[entities.Entity] = set()
+        self._entities: list[entities.Entity] = []  # Kept sorted by y coordinate for drawing
 
         self._title_label = _LevelNameLabel(
             game_engine,
@@ -150,19 +179,24 @@ class Level(scene.Scene):
 
     @property
     def entity_set(self) -> set[entities.Entity]:
-        return self._entities
+        return self._entity_set
 
     def spawn_player(self, at: pygame.Vector2):
         if self._player:
             raise RuntimeError('player entity already exists')
         self._player = entities.PlayerEntity('Character', self, 1.5)
         self._player.position = at
-        self._entities.add(self._player)
+        self._add_entity(self._player)
 
     def spawn_entity(self, supplier: _typ.Callable[[Level], entities.Entity], at: pygame.Vector2):
         entity = supplier(self)
         entity.position = at
-        self._entities.add(entity)
+        self._add_entity(entity)
+
+    def _add_entity(self, entity: entities.Entity):
+        if entity not in self._entity_set:
+            self._entity_set.add(entity)
+            self._entities.append(entity)
 
     def on_input_event(self, event: pygame.event.Event):
         if (not super().on_input_event(event)
@@ -204,62 +238,103 @@ class Level(scene.Scene):
         ww, wh = self._game_engine.window_size
         player_pos = self._player.position
         if w <= ww:
-            self._camera_pos.x = (w - ww) / 2
+            self._camera_x = (w - ww) / 2
         else:
-            self._camera_pos.x = (player_pos.x + 0.5) * constants.SCREEN_TILE_SIZE - ww / 2
+            self._camera_x = (player_pos.x + 0.5) * constants.SCREEN_TILE_SIZE - ww / 2
         if h <= wh:
-            self._camera_pos.y = (h - wh) / 2
+            self._camera_y = (h - wh) / 2
         else:
-            self._camera_pos.y = (player_pos.y + 0.5) * constants.SCREEN_TILE_SIZE - wh / 2
+            self._camera_y = (player_pos.y + 0.5) * constants.SCREEN_TILE_SIZE - wh / 2
+
+    def _get_chunk(self, chunk_x: int, chunk_y: int) -> tuple[pygame.Surface, pygame.Surface | None]:
+        """Return the pre-rendered tile layers of a chunk, rendering them if needed.
+
+        :param chunk_x: Chunk’s x coordinate, in chunks.
+        :param chunk_y: Chunk’s y coordinate, in chunks.
+        :return: The bottom and top layers surfaces; top is None if there are no layers above entities.
+        """
+        key = (chunk_x, chunk_y)
+        if (chunk := self._chunks.get(key)) is None:
+            cs = self.CHUNK_SIZE
+            area = pygame.Rect(chunk_x * cs, chunk_y * cs, cs, cs).clip(0, 0, self._width, self._height)
+            size = (area.w * constants.SCREEN_TILE_SIZE, area.h * constants.SCREEN_TILE_SIZE)
+            bottom = pygame.Surface(size).convert()
+            bottom.fill(self._background_color)
+            self._render_layers(bottom, self._bottom_layers, area)
+            top = None
+            if self._top_layers:
+                top = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+                self._render_layers(top, self._top_layers, area)
+            chunk = self._chunks[key] = (bottom, top)
+        return chunk
+
+    def _render_layers(self, surface: pygame.Surface, layers: range, area: pygame.Rect):
+        """Render the tiles of the given layers and area onto a surface.
+
+        :param surface: The surface to draw on.
+        :param layers: Indices of the layers to render, from bottom to top.
+        :param area: The area to render, in tiles; its top-left corner is drawn at the surface’s origin.
+        """
+        get_tile = self._game_engine.texture_manager.get_tile
+        ts = constants.SCREEN_TILE_SIZE
+        for layer in layers:
+            rows = self._tiles[layer][area.top:area.bottom]
+            surface.blits([(get_tile(tile.tile_id, tile.tileset_id), (x * ts, y * ts))
+                           for y, row in enumerate(rows)
+                           for x, tile in enumerate(row[area.left:area.right]) if tile], doreturn=False)
 
     def draw(self, screen: pygame.Surface):
         self._update_camera_position()
         screen.fill(self._background_color)
+        sw, sh = screen.get_size()
+        ts = constants.SCREEN_TILE_SIZE
+        scale = constants.SCALE
+        cx, cy = self._camera_x, self._camera_y
+        blit = screen.blit
         # Render layers and entities
-        for layer in range(len(self._tiles)):
-            for y in range(self._height):
-                for x in range(self._width):
-                    tile = self.get_tile(layer, x, y)
-                    pos = pygame.Vector2(x, y)
-                    # Culling
-                    size = pygame.Vector2(constants.SCREEN_TILE_SIZE, constants.SCREEN_TILE_SIZE)
-                    if tile and self.is_rect_visible(screen, self._screen_pos(pos), size):
-                        self._draw_tile(tile, pos, screen)
-            if layer == self._entity_layer:
-                for entity in self._entities:
-                    # Culling
-                    if self.is_rect_visible(screen, self._screen_pos(entity.position), entity.size * constants.SCALE):
-                        self._draw_entity(entity, screen)
+        cs = self.CHUNK_SIZE
+        chunk_px = cs * ts
+        chunks_x = range(max(0, int(cx // chunk_px)), min((self._width - 1) // cs, int((cx + sw) // chunk_px)) + 1)
+        chunks_y = range(max(0, int(cy // chunk_px)), min((self._height - 1) // cs, int((cy + sh) // chunk_px)) + 1)
+        chunks = [(self._get_chunk(x, y), (x * chunk_px, y * chunk_px)) for y in chunks_y for x in chunks_x]
+        # Drop chunks that are more than one chunk away from the screen,
+        # keeping a margin avoids re-rendering chunks when moving back and forth across a chunk border
+        x_min, x_max = chunks_x.start - 1, chunks_x.stop
+        y_min, y_max = chunks_y.start - 1, chunks_y.stop
+        if any(not (x_min <= x <= x_max and y_min <= y <= y_max) for x, y in self._chunks):
+            self._chunks = {(x, y): chunk for (x, y), chunk in self._chunks.items()
+                            if x_min <= x <= x_max and y_min <= y <= y_max}
+        # Layers and entities share the same integer offset so that they are rounded the same way
+        ox, oy = int(-cx), int(-cy)
+        screen.blits([(bottom, (ox + x, oy + y)) for (bottom, _), (x, y) in chunks], doreturn=False)
+        # Draw entities from top to bottom so that lower ones overlap those above them.
+        # Entities move only slightly between frames so the list is almost always already sorted.
+        self._entities.sort(key=lambda e: e.position.y)
+        for entity in self._entities:
+            pos = entity.position
+            x = ox + pos.x * ts
+            y = oy + pos.y * ts
+            w, h = entity.size
+            # Culling
+            if -w * scale <= x <= sw and -h * scale <= y <= sh:
+                blit(entity.get_texture(), (x, y))
+        if self._top_layers:
+            screen.blits([(top, (ox + x, oy + y)) for (_, top), (x, y) in chunks], doreturn=False)
         # Render level name label
         if self._title_label.is_visible:
             self._title_label.draw(screen)
 
-    def is_rect_visible(self, screen: pygame.Surface, pos: pygame.Vector2, size: pygame.Vector2) -> bool:
-        w, h = screen.get_size()
-        return -size[0] <= pos.x <= w and -size[1] <= pos.y <= h
-
-    def _draw_tile(self, tile: Tile, pos: pygame.Vector2, screen: pygame.Surface):
-        texture = self._game_engine.texture_manager.get_tile(tile.tile_id, tile.tileset_id)
-        screen.blit(texture, self._screen_pos(pos))
-
-    def _draw_entity(self, entity: entities.Entity, screen: pygame.Surface):
-        screen.blit(entity.get_texture(), self._screen_pos(entity.position))
-
-    def get_tile(self, layer: int, x: int, y: int):
-        if x < 0 or y < 0 or x >= self._width or y >= self._height:
-            raise IndexError(f'({x}, {y})')
-        return self._tiles[layer][y][x]
-
     def get_tile_interaction(self, x: int, y: int):
         if x < 0 or y < 0 or x >= self._width or y >= self._height:
             return inter.WALL_INTERACTION
         return self._interactions[y][x]
 
-    def _screen_pos(self, pos: pygame.Vector2) -> pygame.Vector2:
-        return pos * constants.SCREEN_TILE_SIZE - self._camera_pos
-
 
 class _LevelNameLabel(_comp.Component):
+    BG_ALPHA = 128
+    # Left and right gradient images, keyed by (height, gradient width). Shared by all labels.
+    _gradients_cache: dict[tuple[int, int], tuple[pygame.Surface, pygame.Surface]] = {}
+
     def __init__(self, game_engine, title: str):
         """Create a level label.
 
@@ -270,8 +345,11 @@ class _LevelNameLabel(_comp.Component):
         super().__init__(game_engine)
         self._label = texts.parse_line(title)
         self._gradient_width = 30
-        self._title_timer = None
+        # Times at which the label should appear and disappear, set on first update
+        self._show_time: int | None = None
+        self._hide_time: int | None = None
         self._visible = False
+        self._done = False
         self.w, self.h = self._label.get_size(self._tm)
         self._update_image()
 
@@ -280,32 +358,52 @@ class _LevelNameLabel(_comp.Component):
         return self._visible
 
     def update(self):
-        if self._title_timer is None:
-            self._title_timer = time.time()
+        if self._done:  # Label has been hidden for good
+            return
+        now = pygame.time.get_ticks()
+        if self._show_time is None:
+            self._show_time = now + 500
+            self._hide_time = now + 3000
         else:
-            self._visible = 0.5 <= time.time() - self._title_timer <= 3
+            self._visible = self._show_time <= now <= self._hide_time
+            self._done = now > self._hide_time
 
     def _draw(self) -> pygame.Surface:
         return self._image
 
     def _update_image(self):
-        size = self._label.get_size(self._tm)
-        alpha = 128
-        image = pygame.Surface(size, pygame.SRCALPHA, 32)
-        image.fill((0, 0, 0, alpha))
+        w, h = self.w, self.h  # Label size, already computed by __init__
+        gw = self._gradient_width
+        image = pygame.Surface((w, h), pygame.SRCALPHA, 32)
+        image.fill((0, 0, 0, self.BG_ALPHA))
         self._label.draw(self._tm, image, (0, 0))
 
-        w, h = size
-        self._image = pygame.Surface((w + 2 * self._gradient_width, h), pygame.SRCALPHA, 32)
-        _rutil.alpha_gradient(self._image, pygame.Color(0, 0, 0), 0, alpha,
-                              rect=pygame.Rect(0, 0, self._gradient_width, h))
-        _rutil.alpha_gradient(self._image, pygame.Color(0, 0, 0), alpha, 0,
-                              rect=pygame.Rect(w + self._gradient_width, 0, self._gradient_width, h))
-        self._image.blit(image, (self._gradient_width, 0))
+        left_gradient, right_gradient = self._get_gradients(h)
+        self._image = pygame.Surface((w + 2 * gw, h), pygame.SRCALPHA, 32).convert_alpha()
+        self._image.blit(left_gradient, (0, 0))
+        self._image.blit(right_gradient, (w + gw, 0))
+        self._image.blit(image, (gw, 0))
 
+    def _get_gradients(self, h: int) -> tuple[pygame.Surface, pygame.Surface]:
+        """Return the gradients to put on each side of a label. Gradients only depend on the label’s height,
+        they are created once and reused by all labels with the same height.
 
-@dataclasses.dataclass(frozen=True)
-class Tile:
+        :param h: Label’s height.
+        :return: The left and right gradients.
+        """
+        key = (h, self._gradient_width)
+        if (gradients := self._gradients_cache.get(key)) is None:
+            size = (self._gradient_width, h)
+            black = pygame.Color(0, 0, 0)
+            left_gradient = pygame.Surface(size, pygame.SRCALPHA, 32)
+            _rutil.alpha_gradient(left_gradient, black, 0, self.BG_ALPHA)
+            right_gradient = pygame.Surface(size, pygame.SRCALPHA, 32)
+            _rutil.alpha_gradient(right_gradient, black, self.BG_ALPHA, 0)
+            gradients = self._gradients_cache[key] = (left_gradient, right_gradient)
+        return gradients
+
+
+class Tile(_typ.NamedTuple):
     tileset_id: int
     tile_id: int
 
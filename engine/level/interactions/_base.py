@@ -4,6 +4,12 @@ from ... import entities, io
 
 
 class TileInteraction(abc.ABC):
+    """Base class for interactions attached to level cells.
+
+    Cells with identical interactions share a single instance, interactions must thus never be mutated
+    once created. To change the interaction of a single cell, replace it with a new instance.
+    """
+
     def __init__(self, id_: int):
         self._id = id_
 
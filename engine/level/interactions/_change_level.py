@@ -5,6 +5,10 @@ from ... import entities, io, events
 
 
 class ChangeLevelInteraction(_base.TileInteraction):
+    """Sends the player to another level. The door’s state is fixed at creation and shared by all cells
+    using this instance; opening or unlocking a door must replace the cell’s interaction.
+    """
+
     OPEN = 0
     CLOSED = 1
     LOCKED = 2
@@ -12,13 +16,14 @@ class ChangeLevelInteraction(_base.TileInteraction):
     def __init__(self, destination_map: str, player_spawn_location: pygame.Vector2, state: int, hidden: bool):
         super().__init__(2)
         self._dest_map = destination_map
-        self._position = player_spawn_location.copy()
+        # Immutable coordinates, no need to defensively copy them on each access
+        self._position = (player_spawn_location.x, player_spawn_location.y)
         self._state = state
         self._hidden = hidden
 
     @property
     def player_spawn_location(self) -> pygame.Vector2:
-        return self._position.copy()
+        return pygame.Vector2(self._position)
 
     @property
     def destination_map(self) -> str:
@@ -40,12 +45,12 @@ class ChangeLevelInteraction(_base.TileInteraction):
         return self.is_open and isinstance(entity, entities.PlayerEntity)
 
     def on_entity_inside(self, level, entity: entities.Entity):
-        level.game_engine.fire_event(events.ChangeLevelEvent(self._dest_map, self._position))
+        level.game_engine.fire_event(events.ChangeLevelEvent(self._dest_map, self.player_spawn_location))
 
     def write_to_buffer(self, buffer: io.ByteBuffer):
         super().write_to_buffer(buffer)
         buffer.write_string(self._dest_map)
-        buffer.write_vector(self._position, as_ints=True)
+        buffer.write_vector(self.player_spawn_location, as_ints=True)
         buffer.write_byte(self._state, signed=False)
         buffer.write_bool(self._hidden)
 
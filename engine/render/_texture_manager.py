@@ -1,7 +1,7 @@
-import collections
 import json
 import logging
 import os
+import pathlib
 
 import pygame
 
@@ -18,63 +18,115 @@ class TexturesManager:
     UNDERLINED = 4
     STRIKETHROUGH = 8
 
+    TEXT_CACHE_SIZE = 512  # Maximum number of rendered texts to keep
+
     def __init__(self, font: pygame.font.Font):
         """Create a texture manager.
 
         :param font: The font to use for all texts.
         """
         size = constants.TILE_SIZE
-        self._missing_texture = pygame.Surface((size, size))
+        self._missing_texture = pygame.Surface((size, size)).convert()
         magenta = (255, 0, 255)
         black = (0, 0, 0)
+        self._missing_texture.fill(black)
         self._missing_texture.fill(magenta, (0, 0, size // 2, size // 2))
         self._missing_texture.fill(magenta, (size // 2, size // 2, size // 2, size // 2))
-        self._missing_texture.fill(black, (size // 2, 0, size // 2, size // 2))
-        self._missing_texture.fill(black, (size // 2, 0, size // 2, size // 2))
 
         self._font = font
-        self._tilesets: dict[int, tuple[pygame.Surface, int]] = collections.defaultdict(
-            lambda: (self._missing_texture, size))
-        self._sprite_sheets: dict[str, tuple[pygame.Surface, tuple[int, int], int]] = collections.defaultdict(
-            lambda: (self._missing_texture, (size, size), 1))
+        # Tileset and sprite sheet files are only listed here, images are loaded when first requested
+        self._tileset_files: dict[int, tuple[pathlib.Path, int]] = {}
+        self._tilesets: dict[int, tuple[pygame.Surface, int]] = {}
+        self._sprite_sheet_files: dict[str, pathlib.Path] = {}
+        self._sprite_sheets: dict[str, tuple[pygame.Surface, tuple[int, int], int]] = {}
+        # Scaled tile textures, keyed by (tile index, tileset ID)
+        self._tiles_cache: dict[tuple[int, int], pygame.Surface] = {}
+        # Scaled sprite textures, keyed by (sprite index, sprite sheet name)
+        self._sprites_cache: dict[tuple[int, str], pygame.Surface] = {}
+        # Menu box textures, keyed by (position, size)
+        self._menu_textures_cache: dict[tuple[tuple[int, int], tuple[int, int]], pygame.Surface] = {}
+        # Rendered texts, keyed by (text, color, style), oldest first
+        self._texts_cache: dict[tuple[str, tuple[int, int, int, int], int], pygame.Surface] = {}
         self._logger = logging.getLogger(self.__class__.__qualname__)
         self._logger.debug('Loading textures…')
-        self._load_tilesets()
-        self._load_sprite_sheets()
+        self._list_tilesets()
+        self._list_sprite_sheets()
         self._menu_box_texture = pygame.image.load(constants.MENUS_TEX_DIR / 'menu_box.png').convert_alpha()
         self._logger.debug('Done.')
 
-    def _load_tilesets(self):
-        self._logger.debug('Loading tilesets…')
+    def _list_tilesets(self):
+        self._logger.debug('Listing tilesets…')
         with (constants.TILESETS_DIR / constants.TILESETS_INDEX_FILE_NAME).open(mode='r', encoding='UTF-8') as f:
             tilesets = json.load(f)
 
         for i, tileset in enumerate(tilesets):
-            textures = pygame.image.load(constants.TILESETS_DIR / tileset).convert_alpha()
             with (constants.TILESETS_DIR / (tileset + '.json')).open(mode='r', encoding='UTF-8') as f:
                 resolution = int(json.load(f)['resolution'])
-            self._tilesets[i + 1] = (textures, resolution)
-        self._logger.debug('Loaded tilesets.')
+            self._tileset_files[i + 1] = (constants.TILESETS_DIR / tileset, resolution)
+        self._logger.debug('Listed tilesets.')
 
-    def _load_sprite_sheets(self):
-        self._logger.debug('Loading sprite sheets…')
+    def _list_sprite_sheets(self):
+        self._logger.debug('Listing sprite sheets…')
         for sprite_sheet in constants.SPRITES_DIR.glob('*.png'):
             if sprite_sheet.is_file():
-                name = os.path.splitext(sprite_sheet.name)[0]
-                textures = pygame.image.load(sprite_sheet).convert_alpha()
-                with (sprite_sheet.parent / (sprite_sheet.name + '.json')).open(mode='r', encoding='UTF-8') as f:
+                self._sprite_sheet_files[os.path.splitext(sprite_sheet.name)[0]] = sprite_sheet
+        self._logger.debug('Listed sprite sheets.')
+
+    def _get_tileset(self, tileset: int) -> tuple[pygame.Surface, int]:
+        if (data := self._tilesets.get(tileset)) is None:
+            if (file := self._tileset_files.get(tileset)) is None:
+                size = constants.TILE_SIZE
+                data = (self._scale(self._missing_texture), size)
+            else:
+                path, resolution = file
+                self._logger.debug(f'Loading tileset {path.name}…')
+                data = (self._scale(pygame.image.load(path).convert_alpha()), resolution)
+            self._tilesets[tileset] = data
+        return data
+
+    def _get_sprite_sheet(self, sprite_sheet: str) -> tuple[pygame.Surface, tuple[int, int], int]:
+        if (data := self._sprite_sheets.get(sprite_sheet)) is None:
+            if (path := self._sprite_sheet_files.get(sprite_sheet)) is None:
+                size = constants.TILE_SIZE
+                data = (self._scale(self._missing_texture), (size, size), 1)
+            else:
+                self._logger.debug(f'Loading sprite sheet {path.name}…')
+                textures = pygame.image.load(path).convert_alpha()
+                with (path.parent / (path.name + '.json')).open(mode='r', encoding='UTF-8') as f:
                     json_data = json.load(f)
                 res = json_data['resolution']
                 resolution = (int(res[0]), int(res[1]))
                 frames = textures.get_width() // resolution[0] - 1  # First column is idle frame
-                self._sprite_sheets[name] = (textures, resolution, frames)
-        self._logger.debug('Loaded sprite sheets.')
+                data = (self._scale(textures), resolution, frames)
+            self._sprite_sheets[sprite_sheet] = data
+        return data
+
+    @staticmethod
+    def _scale(sheet: pygame.Surface) -> pygame.Surface:
+        scale = constants.SCALE
+        return pygame.transform.scale(sheet, (sheet.get_width() * scale, sheet.get_height() * scale))
 
     @property
     def font(self) -> pygame.font.Font:
         return self._font
 
     def render_text(self, text: str, color: pygame.Color = DEFAULT_FONT_COLOR, style: int = NORMAL) -> pygame.Surface:
+        """Render the given text. Surfaces are shared between calls and must not be modified.
+
+        :param text: The text to render.
+        :param color: Text’s color.
+        :param style: Text’s style, a combination of NORMAL, ITALICS, BOLD, UNDERLINED and STRIKETHROUGH.
+        :return: The rendered text.
+        """
+        key = (text, tuple(color), style)
+        if (image := self._texts_cache.get(key)) is None:
+            if len(self._texts_cache) >= self.TEXT_CACHE_SIZE:
+                # Texts may change every frame (e.g. debug info), evict the oldest one
+                del self._texts_cache[next(iter(self._texts_cache))]
+            image = self._texts_cache[key] = self._render_text(text, color, style)
+        return image
+
+    def _render_text(self, text: str, color: pygame.Color, style: int) -> pygame.Surface:
         self._font.set_italic((style & self.ITALICS) != 0)
         self._font.set_bold((style & self.BOLD) != 0)
         self._font.set_underline((style & self.UNDERLINED) != 0)
@@ -87,34 +139,60 @@ class TexturesManager:
         return text
 
     def get_tile(self, index: int, tileset: int) -> pygame.Surface:
-        size = self._tilesets[tileset][1]
-        return self._get_texture(index, self._tilesets[tileset][0], (size, size))
+        """Return the texture of a tile. Textures are shared between calls and must not be modified.
+
+        :param index: Tile’s index in its tileset.
+        :param tileset: Tileset’s ID.
+        :return: The scaled tile texture.
+        """
+        key = (index, tileset)
+        if (texture := self._tiles_cache.get(key)) is None:
+            tileset_texture, size = self._get_tileset(tileset)
+            texture = self._tiles_cache[key] = self._get_texture(index, tileset_texture, (size, size))
+        return texture
 
     def get_sprite(self, index: int, sprite_sheet: str) -> pygame.Surface:
-        sheet_data = self._sprite_sheets[sprite_sheet]
-        return self._get_texture(index, sheet_data[0], sheet_data[1])
+        """Return the texture of a sprite. Textures are shared between calls and must not be modified.
+
+        :param index: Sprite’s index in its sprite sheet.
+        :param sprite_sheet: Sprite sheet’s name.
+        :return: The scaled sprite texture.
+        """
+        key = (index, sprite_sheet)
+        if (texture := self._sprites_cache.get(key)) is None:
+            sheet, size, _ = self._get_sprite_sheet(sprite_sheet)
+            texture = self._sprites_cache[key] = self._get_texture(index, sheet, size)
+        return texture
 
     def get_sprite_size(self, sprite_sheet: str) -> tuple[int, int]:
-        return self._sprite_sheets[sprite_sheet][1]
+        return self._get_sprite_sheet(sprite_sheet)[1]
 
     def get_sprite_frames(self, sprite_sheet: str) -> int:
-        return self._sprite_sheets[sprite_sheet][2]
+        return self._get_sprite_sheet(sprite_sheet)[2]
 
     def get_menu_texture(self, position: tuple[int, int], size: tuple[int, int]) -> pygame.Surface:
-        image = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
-        image.blit(self._menu_box_texture, (0, 0), (*position, *size))
-        return pygame.transform.scale(image, size)
-
-    def _get_texture(self, index: int, sheet: pygame.Surface, size: tuple[int, int]) -> pygame.Surface:
-        image = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
-        w, h = size
-        sw = sheet.get_size()[0] // w
-        sh = sheet.get_size()[1] // h
+        """Return a region of the menu box texture. Textures are shared between calls and must not be modified.
+
+        :param position: Region’s top-left corner in the menu box texture.
+        :param size: Region’s size.
+        :return: The texture region.
+        """
+        key = (tuple(position), tuple(size))
+        if (image := self._menu_textures_cache.get(key)) is None:
+            image = self._menu_textures_cache[key] = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+            image.blit(self._menu_box_texture, (0, 0), (*position, *size))
+        return image
+
+    @staticmethod
+    def _get_texture(index: int, sheet: pygame.Surface, size: tuple[int, int]) -> pygame.Surface:
+        # Sheets are scaled once when loaded, textures are views on their pixels
+        scale = constants.SCALE
+        w, h = size[0] * scale, size[1] * scale
+        sw = sheet.get_width() // w
+        sh = sheet.get_height() // h
         x = index % sw
         y = (index // sw) % sh
-        image.blit(sheet, (0, 0), (x * w, y * h, *size))
-        scale = constants.SCALE
-        return pygame.transform.scale(image, (w * scale, h * scale))
+        return sheet.subsurface((x * w, y * h, w, h))
 
 
 __all__ = [
@@ -22,29 +22,19 @@ def fill_gradient(surface: pygame.Surface, start_color: pygame.Color, end_color:
         h = x2 - x1
     else:
         h = y2 - y1
-    rate = (
-        float(end_color.r - start_color.r) / h,
-        float(end_color.g - start_color.g) / h,
-        float(end_color.b - start_color.b) / h,
-    )
+    # The ramp stays between both colors, no need to clamp each component
+    r, g, b = start_color.r, start_color.g, start_color.b
+    dr = (end_color.r - r) / h
+    dg = (end_color.g - g) / h
+    db = (end_color.b - b) / h
+    a = end_color.a if alpha else 255
+    draw_line = pygame.draw.line
     if horizontal:
-        for col in range(x1, x2):
-            start_color = (
-                min(max(start_color.r + (rate[0] * (col - x1)), 0), 255),
-                min(max(start_color.g + (rate[1] * (col - x1)), 0), 255),
-                min(max(start_color.b + (rate[2] * (col - x1)), 0), 255),
-                end_color.a if alpha else 255
-            )
-            pygame.draw.line(surface, start_color, (col, y1), (col, y2))
+        for i, col in enumerate(range(x1, x2)):
+            draw_line(surface, (r + dr * i, g + dg * i, b + db * i, a), (col, y1), (col, y2))
     else:
-        for line in range(y1, y2):
-            start_color = (
-                min(max(start_color.r + (rate[0] * (line - y1)), 0), 255),
-                min(max(start_color.g + (rate[1] * (line - y1)), 0), 255),
-                min(max(start_color.b + (rate[2] * (line - y1)), 0), 255),
-                end_color.a if alpha else 255
-            )
-            pygame.draw.line(surface, start_color, (x1, line), (x2, line))
+        for i, line in enumerate(range(y1, y2)):
+            draw_line(surface, (r + dr * i, g + dg * i, b + db * i, a), (x1, line), (x2, line))
 
 
 def alpha_gradient(surface: pygame.Surface, color: pygame.Color, start_alpha: int, end_alpha: int,
@@ -66,12 +56,13 @@ def alpha_gradient(surface: pygame.Surface, color: pygame.Color, start_alpha: in
         h = x2 - x1
     else:
         h = y2 - y1
+    # The ramp stays between both alpha values, no need to clamp it
     rate = (end_alpha - start_alpha) / h
+    rgb = (color.r, color.g, color.b)
+    draw_line = pygame.draw.line
     if horizontal:
-        for col in range(x1, x2):
-            c = (color.r, color.g, color.b, min(max(start_alpha + (rate * (col - x1)), 0), 255))
-            pygame.draw.line(surface, c, (col, y1), (col, y2))
+        for i, col in enumerate(range(x1, x2)):
+            draw_line(surface, (*rgb, start_alpha + rate * i), (col, y1), (col, y2))
     else:
-        for line in range(y1, y2):
-            c = (color.r, color.g, color.b, min(max(start_alpha + (rate * (line - y1)), 0), 255))
-            pygame.draw.line(surface, c, (x1, line), (x2, line))
+        for i, line in enumerate(range(y1, y2)):
+            draw_line(surface, (*rgb, start_alpha + rate * i), (x1, line), (x2, line))
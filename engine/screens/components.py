@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import abc
-import itertools as _it
 import typing as _typ
 
 import pygame
@@ -28,6 +27,7 @@ class Component(abc.ABC):
         self._h = 0
         self._padding = padding
         self._enabled = True
+        self._version = 0  # Incremented each time this component’s image changes
 
     @property
     def w(self) -> int:
@@ -102,13 +102,16 @@ class StandaloneComponent(Component, abc.ABC):
         """
         super().__init__(game_engine, padding=padding)
         self._bg_texture = None
+        self._bg_key = None  # (w, h, padding) that the background was built for
 
     def set_center(self):
         self.x = (self._game_engine.window_size[0] - self.size[0]) / 2
         self.y = (self._game_engine.window_size[1] - self.size[1]) / 2
 
     def _on_size_changed(self):
-        self._update_bg()
+        # Rebuilt lazily on next draw, so that setting both w and h only rebuilds it once
+        if self._bg_key != (self.w, self.h, self._padding):
+            self._bg_texture = None
 
     def draw(self, screen: pygame.Surface):
         if self._bg_texture is None:
@@ -116,58 +119,46 @@ class StandaloneComponent(Component, abc.ABC):
         return super().draw(screen)
 
     def _update_bg(self):
-        self._bg_texture = pygame.Surface(self.size, pygame.SRCALPHA)
+        self._bg_texture = pygame.Surface(self.size, pygame.SRCALPHA).convert_alpha()
+        get_menu_texture = self._tm.get_menu_texture
         w, h = self.w, self.h
         pad = self._padding
+        self._bg_key = (w, h, pad)
         size = (pad, pad)
-        top_left = self._tm.get_menu_texture((0, 0), size)
-        top_right = self._tm.get_menu_texture((2 * pad, 0), size)
-        bottom_left = self._tm.get_menu_texture((0, 2 * pad), size)
-        bottom_right = self._tm.get_menu_texture((2 * pad, 2 * pad), size)
-        self._bg_texture.blit(top_left, (0, 0))
-        self._bg_texture.blit(top_right, (pad + w, 0))
-        self._bg_texture.blit(bottom_left, (0, pad + h))
-        self._bg_texture.blit(bottom_right, (pad + w, pad + h))
-        # Sides
         horizontal_nb = w // pad
         horizontal_diff = w - pad * horizontal_nb
         vertical_nb = h // pad
         vertical_diff = h - pad * vertical_nb
-        # Full vertical sides
-        for i in range(vertical_nb):
-            left_side = self._tm.get_menu_texture((0, pad), size)
-            self._bg_texture.blit(left_side, (0, pad * (i + 1)))
-            right_side = self._tm.get_menu_texture((2 * pad, pad), size)
-            self._bg_texture.blit(right_side, (pad + w, pad * (i + 1)))
-            # Full background
-            for j in range(horizontal_nb):
-                bg = self._tm.get_menu_texture((pad, pad), size)
-                self._bg_texture.blit(bg, (pad * (j + 1), pad * (i + 1)))
-            # Partial vertical background
-            bg = self._tm.get_menu_texture((pad, pad), (horizontal_diff, pad))
-            self._bg_texture.blit(bg, (pad * (horizontal_nb + 1), pad * (i + 1)))
-        # Partial vertical sides
-        left_side = self._tm.get_menu_texture((0, pad), (pad, vertical_diff))
-        self._bg_texture.blit(left_side, (0, pad * (vertical_nb + 1)))
-        right_side = self._tm.get_menu_texture((2 * pad, pad), (pad, vertical_diff))
-        self._bg_texture.blit(right_side, (pad + w, pad * (vertical_nb + 1)))
-        # Full horizontal sides
-        for i in range(horizontal_nb):
-            top_side = self._tm.get_menu_texture((pad, 0), size)
-            self._bg_texture.blit(top_side, (pad * (i + 1), 0))
-            bottom_side = self._tm.get_menu_texture((pad, 2 * pad), size)
-            self._bg_texture.blit(bottom_side, (pad * (i + 1), pad + h))
-            # Partial horizontal background
-            bg = self._tm.get_menu_texture((pad, pad), (pad, vertical_diff))
-            self._bg_texture.blit(bg, (pad * (i + 1), pad * (vertical_nb + 1)))
-        # Partial horizontal sides
-        top_side = self._tm.get_menu_texture((pad, 0), (horizontal_diff, pad))
-        self._bg_texture.blit(top_side, (pad * (horizontal_nb + 1), 0))
-        bottom_side = self._tm.get_menu_texture((pad, 2 * pad), (horizontal_diff, pad))
-        self._bg_texture.blit(bottom_side, (pad * (horizontal_nb + 1), pad + h))
-        # Partial background bottom-right corner
-        bg = self._tm.get_menu_texture((pad, pad), (horizontal_diff, vertical_diff))
-        self._bg_texture.blit(bg, (pad * (horizontal_nb + 1), pad * (vertical_nb + 1)))
+        # Background, tiled into a single row that is then repeated, the last one partially
+        row = pygame.Surface((w, pad), pygame.SRCALPHA)
+        bg = get_menu_texture((pad, pad), size)
+        row.blits([(bg, (pad * j, 0)) for j in range(horizontal_nb + 1)], doreturn=False)
+        left_side = get_menu_texture((0, pad), size)
+        right_side = get_menu_texture((2 * pad, pad), size)
+        top_side = get_menu_texture((pad, 0), size)
+        bottom_side = get_menu_texture((pad, 2 * pad), size)
+        # Pieces do not overlap, draw them all in a single call
+        self._bg_texture.blits([
+            # Corners
+            (get_menu_texture((0, 0), size), (0, 0)),
+            (get_menu_texture((2 * pad, 0), size), (pad + w, 0)),
+            (get_menu_texture((0, 2 * pad), size), (0, pad + h)),
+            (get_menu_texture((2 * pad, 2 * pad), size), (pad + w, pad + h)),
+            # Full vertical sides and background rows
+            *((left_side, (0, pad * (i + 1))) for i in range(vertical_nb)),
+            *((right_side, (pad + w, pad * (i + 1))) for i in range(vertical_nb)),
+            *((row, (pad, pad * (i + 1))) for i in range(vertical_nb)),
+            # Partial vertical sides and background row
+            (get_menu_texture((0, pad), (pad, vertical_diff)), (0, pad * (vertical_nb + 1))),
+            (get_menu_texture((2 * pad, pad), (pad, vertical_diff)), (pad + w, pad * (vertical_nb + 1))),
+            (row, (pad, pad * (vertical_nb + 1)), (0, 0, w, vertical_diff)),
+            # Full horizontal sides
+            *((top_side, (pad * (i + 1), 0)) for i in range(horizontal_nb)),
+            *((bottom_side, (pad * (i + 1), pad + h)) for i in range(horizontal_nb)),
+            # Partial horizontal sides
+            (get_menu_texture((pad, 0), (horizontal_diff, pad)), (pad * (horizontal_nb + 1), 0)),
+            (get_menu_texture((pad, 2 * pad), (horizontal_diff, pad)), (pad * (horizontal_nb + 1), pad + h)),
+        ], doreturn=False)
 
 
 class MenuComponent(Component, abc.ABC):
@@ -184,9 +175,10 @@ class Spacer(MenuComponent):
         :param padding: Inner padding.
         """
         super().__init__(game_engine, padding)
+        self._image = pygame.Surface((0, 0))
 
     def _draw(self) -> pygame.Surface:
-        return pygame.Surface((0, 0))
+        return self._image
 
 
 class Label(MenuComponent):
@@ -217,7 +209,8 @@ class Label(MenuComponent):
         return self._image
 
     def _update_image(self):
-        self._image = pygame.Surface(self.size, pygame.SRCALPHA)
+        self._version += 1
+        self._image = pygame.Surface(self.size, pygame.SRCALPHA).convert_alpha()
         text = texts.parse_line(self._text)
         text.draw(self._tm, self._image, (self._padding, self._padding))
 
@@ -314,7 +307,8 @@ class Button(MenuComponent):
 
         tm = self._tm
         w, h = self.w, self.h
-        self._image = pygame.Surface(self.size, pygame.SRCALPHA)
+        self._version += 1
+        self._image = pygame.Surface(self.size, pygame.SRCALPHA).convert_alpha()
 
         label = texts.parse_line(self._raw_label)
         if not self._enabled:
@@ -366,10 +360,15 @@ class Menu(StandaloneComponent):
         self._layout = layout
         self._grid: list[list[MenuComponent | None]] = [[None] * columns for _ in range(rows)]
         self._buttons_nb = 0
+        # Flat views of the grid’s contents, in insertion order
+        self._items: list[MenuComponent] = []
+        self._buttons: list[Button] = []
         self._selection = None
         self._gap = gap
         self.has_focus = True
         self.is_visible = True
+        self._image: pygame.Surface | None = None
+        self._image_key = None  # State that the current image was drawn from
 
     @property
     def parent(self) -> Menu | None:
@@ -403,9 +402,8 @@ class Menu(StandaloneComponent):
             self._on_hide(self)
 
     def _on_enable_changed(self):
-        for r, c in _it.product(range(self._grid_height), range(self._grid_width)):
-            if button := self.get_button(r, c):
-                button.enabled = self._enabled
+        for button in self._buttons:
+            button.enabled = self._enabled
 
     def add_item(self, c: MenuComponent) -> MenuComponent:
         if not isinstance(c, MenuComponent):
@@ -418,6 +416,9 @@ class Menu(StandaloneComponent):
             row = self._buttons_nb % self._grid_width
             col = self._buttons_nb // self._grid_width
         self._grid[row][col] = c
+        self._items.append(c)
+        if isinstance(c, Button):
+            self._buttons.append(c)
         if not self._selection and isinstance(c, Button):
             self._select_button(row, col)
         self._update_size(row, col, c)
@@ -527,13 +528,22 @@ class Menu(StandaloneComponent):
         return c if isinstance(c, Button) else None
 
     def _draw(self) -> pygame.Surface:
-        image = pygame.Surface(self.size, pygame.SRCALPHA)
+        # Redraw only if the menu or any of its items changed since last time
+        key = (self.is_visible, self.size, self._bg_texture, [(comp._version, comp.x, comp.y) for comp in self._items])
+        if key == self._image_key:
+            return self._image
+        self._image_key = key
+        # Reuse the same surface, only reallocate it when the menu’s size changes
+        size = self.size
+        if self._image is None or self._image.get_size() != size:
+            self._image = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+        else:
+            self._image.fill((0, 0, 0, 0))
+        image = self._image
         if self.is_visible:
             image.blit(self._bg_texture, (0, 0))
-            for r in range(self._grid_height):
-                for c in range(self._grid_width):
-                    if comp := self._grid[r][c]:
-                        comp.draw(image)
+            for comp in self._items:
+                comp.draw(image)
         return image
 
 
@@ -549,7 +559,7 @@ class TextArea(StandaloneComponent):
         self._raw_text = text
         self._text = None
         self.text = text
-        self._image = pygame.Surface(self.size, pygame.SRCALPHA)
+        self._image = pygame.Surface(self.size, pygame.SRCALPHA).convert_alpha()
 
     @property
     def text(self) -> str:
@@ -563,7 +573,7 @@ class TextArea(StandaloneComponent):
 
     def _update_bg(self):
         super()._update_bg()
-        self._image = pygame.Surface(self.size, pygame.SRCALPHA)
+        self._image = pygame.Surface(self.size, pygame.SRCALPHA).convert_alpha()
         self._image.blit(self._bg_texture, (0, 0))
         font_h = self._tm.font.size('a')[1]
         offset = 0
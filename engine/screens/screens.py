@@ -27,11 +27,14 @@ class Screen(scene.Scene, abc.ABC):
         self._bg_image = None
         if background_image:
             try:
-                self._bg_image = pygame.Surface(
-                    self._game_engine.window_size,
-                    pygame.SRCALPHA
-                ).convert()
-                self._bg_image.blit(pygame.image.load(background_image), (0, 0))
+                image = pygame.image.load(background_image)
+                size = self._game_engine.window_size
+                if image.get_size() == size and not image.get_flags() & pygame.SRCALPHA:
+                    self._bg_image = image.convert()
+                else:
+                    # Pad and flatten the image onto a black background once
+                    self._bg_image = pygame.Surface(size).convert()
+                    self._bg_image.blit(image, (0, 0))
             except FileNotFoundError as e:
                 self._game_engine.logger.error(e)
                 self._bg_image = None
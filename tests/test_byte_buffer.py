@@ -0,0 +1,96 @@
+import unittest
+
+import pygame
+
+from engine import io
+
+
+class ByteBufferTestCase(unittest.TestCase):
+    def _round_trip(self, write, read, *values):
+        buffer = io.ByteBuffer()
+        for value in values:
+            write(buffer, value)
+        buffer = io.ByteBuffer(bytes(buffer.bytes))
+        return [read(buffer) for _ in values]
+
+    def test_numbers_round_trip(self):
+        cases = [
+            (io.ByteBuffer.write_bool, io.ByteBuffer.read_bool, (True, False)),
+            (io.ByteBuffer.write_byte, io.ByteBuffer.read_byte, (-128, -1, 0, 127)),
+            (io.ByteBuffer.write_short, io.ByteBuffer.read_short, (-32768, -1, 0, 32767)),
+            (io.ByteBuffer.write_int, io.ByteBuffer.read_int, (-2 ** 31, -1, 0, 2 ** 31 - 1)),
+            (io.ByteBuffer.write_long, io.ByteBuffer.read_long, (-2 ** 63, -1, 0, 2 ** 63 - 1)),
+            (io.ByteBuffer.write_float, io.ByteBuffer.read_float, (-1.5, 0.0, 0.25)),
+            (io.ByteBuffer.write_double, io.ByteBuffer.read_double, (-1e300, 0.0, 0.1)),
+        ]
+        for write, read, values in cases:
+            with self.subTest(read=read.__name__):
+                self.assertEqual(list(values), self._round_trip(write, read, *values))
+
+    def test_unsigned_numbers_round_trip(self):
+        cases = [
+            ('byte', 255),
+            ('short', 65535),
+            ('int', 2 ** 32 - 1),
+            ('long', 2 ** 64 - 1),
+        ]
+        for name, max_value in cases:
+            with self.subTest(name=name):
+                self.assertEqual([0, max_value], self._round_trip(
+                    lambda b, v: getattr(b, f'write_{name}')(v, signed=False),
+                    lambda b: getattr(b, f'read_{name}')(signed=False),
+                    0, max_value
+                ))
+
+    def test_big_endian(self):
+        buffer = io.ByteBuffer()
+        buffer.write_short(0x0102)
+        buffer.write_int(0x03040506)
+        self.assertEqual(b'\x01\x02\x03\x04\x05\x06', bytes(buffer.bytes))
+
+    def test_read_shorts(self):
+        buffer = io.ByteBuffer()
+        values = (0, 1, -1, 32767, -32768)
+        for value in values:
+            buffer.write_short(value)
+        buffer.write_byte(42)
+        buffer = io.ByteBuffer(bytes(buffer.bytes))
+        self.assertEqual(values, buffer.read_shorts(len(values)))
+        # The read cursor is advanced past all values
+        self.assertEqual(42, buffer.read_byte())
+
+    def test_read_shorts_unsigned(self):
+        buffer = io.ByteBuffer(b'\xff\xff\x00\x01')
+        self.assertEqual((65535, 1), buffer.read_shorts(2, signed=False))
+
+    def test_read_shorts_none(self):
+        buffer = io.ByteBuffer(b'\x07')
+        self.assertEqual((), buffer.read_shorts(0))
+        self.assertEqual(7, buffer.read_byte())
+
+    def test_strings_round_trip(self):
+        values = ('', 'a', 'éàç€', '日本語', 'a\x00b')
+        self.assertEqual(list(values), self._round_trip(io.ByteBuffer.write_string, io.ByteBuffer.read_string, *values))
+
+    def test_read_string_from_bytearray(self):
+        buffer = io.ByteBuffer()
+        buffer.write_string('é')
+        buffer.write_byte(3)
+        # Reading must work on the writable bytearray too, and release the view so that it can still grow
+        self.assertEqual('é', buffer.read_string())
+        self.assertEqual(3, buffer.read_byte())
+        buffer.write_byte(4)
+        self.assertEqual(4, buffer.read_byte())
+
+    def test_vectors_round_trip(self):
+        values = (pygame.Vector2(1.5, -2.25), pygame.Vector2(0, 0))
+        self.assertEqual(list(values), self._round_trip(io.ByteBuffer.write_vector, io.ByteBuffer.read_vector, *values))
+        self.assertEqual([pygame.Vector2(3, -4)], self._round_trip(
+            lambda b, v: b.write_vector(v, as_ints=True),
+            lambda b: b.read_vector(as_ints=True),
+            pygame.Vector2(3, -4)
+        ))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+
+from engine import events, game_engine
+
+
+class _SubQuitGameEvent(events.QuitGameEvent):
+    __slots__ = ()
+
+
+class GameEngineEventDispatchTestCase(unittest.TestCase):
+    def setUp(self):
+        # Only the event dispatch state is needed, skip window and resources initialization
+        self.engine = game_engine.GameEngine.__new__(game_engine.GameEngine)
+        self.handled = []
+        self.engine._on_unexpected_event = lambda e: self.handled.append(('unexpected', e))
+        self.engine._event_handlers = {
+            events.QuitGameEvent: lambda e: self.handled.append(('quit', e)),
+            events.WaitEvent: lambda e: self.handled.append(('wait', e)),
+        }
+
+    def test_exact_type(self):
+        event = events.WaitEvent(10)
+        self.engine._handle_event(event)
+        self.assertEqual([('wait', event)], self.handled)
+
+    def test_subclass_uses_parent_handler(self):
+        event = _SubQuitGameEvent()
+        self.engine._handle_event(event)
+        self.assertEqual([('quit', event)], self.handled)
+
+    def test_subclass_handler_is_cached(self):
+        self.engine._handle_event(_SubQuitGameEvent())
+        self.assertIn(_SubQuitGameEvent, self.engine._event_handlers)
+
+    def test_unknown_event(self):
+        event = events.ToggleSceneUpdateEvent(True)
+        self.engine._handle_event(event)
+        self.assertEqual([('unexpected', event)], self.handled)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import datetime
+import os
+import pathlib
+import tempfile
+import unittest
+from unittest import mock
+
+from engine import constants, game_state, inventory
+
+
+class GameStateFlagsTestCase(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        constants.init(root=pathlib.Path(self._tmp_dir.name))
+        constants.SAVES_DIR.mkdir(parents=True)
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def _save_and_load(self, flags: dict[str, game_state.FlagValue]) -> game_state.GameState:
+        state = game_state.GameState()
+        for name, value in flags.items():
+            state.set_flag(name, value)
+        state.save(1)
+        return game_state.GameState(1)
+
+    def test_flags_round_trip(self):
+        flags = {'bool': True, 'int': -42, 'float': 1.5, 'str': 'éà'}
+        loaded = self._save_and_load(flags)
+        for name, value in flags.items():
+            with self.subTest(name=name):
+                self.assertTrue(loaded.is_flag_set(name))
+                self.assertEqual(value, loaded.get_flag(name))
+                self.assertIs(type(value), type(loaded.get_flag(name)))
+
+    def test_no_flags_round_trip(self):
+        self.assertFalse(self._save_and_load({}).is_flag_set('bool'))
+
+    def test_inventory_loaded_after_flags(self):
+        read_indices = []
+        player_inventory_class = inventory.PlayerInventory
+
+        def player_inventory(buffer=None):
+            if buffer is not None:
+                read_indices.append((buffer._read_index, len(buffer)))
+            return player_inventory_class(buffer)
+
+        with mock.patch.object(game_state.inventory, 'PlayerInventory', player_inventory):
+            loaded = self._save_and_load({'bool': False, 'int': 3, 'float': -0.25, 'str': 'a'})
+        # Inventory saving is not implemented yet, the inventory must start right after the flags
+        self.assertEqual(1, len(read_indices))
+        read_index, size = read_indices[0]
+        self.assertEqual(size, read_index)
+        self.assertIsInstance(loaded.player_inventory, inventory.PlayerInventory)
+
+    def test_set_flag_rejects_other_types(self):
+        with self.assertRaises(TypeError):
+            game_state.GameState().set_flag('list', [])
+
+
+
+class ListSavesTestCase(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        constants.init(root=pathlib.Path(self._tmp_dir.name))
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def _create_save(self, name: str) -> pathlib.Path:
+        path = constants.SAVES_DIR / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b'')
+        return path
+
+    def test_no_saves_dir(self):
+        self.assertEqual([], game_state.list_saves())
+
+    def test_empty_saves_dir(self):
+        constants.SAVES_DIR.mkdir(parents=True)
+        self.assertEqual([], game_state.list_saves())
+
+    def test_saves_sorted_by_id(self):
+        for save_id in (10, 2, 1):
+            self._create_save(f'save_{save_id}.dat')
+        self.assertEqual([1, 2, 10], [save_id for save_id, _ in game_state.list_saves()])
+
+    def test_directories_ignored(self):
+        self._create_save('save_1.dat')
+        (constants.SAVES_DIR / 'save_2.dat').mkdir()
+        self.assertEqual([1], [save_id for save_id, _ in game_state.list_saves()])
+
+    def test_save_date_is_modification_time(self):
+        date = datetime.datetime(2021, 3, 4, 5, 6, 7)
+        path = self._create_save('save_1.dat')
+        timestamp = date.timestamp() + 0.5  # Sub-second part must be dropped
+        os.utime(path, (timestamp, timestamp))
+        self.assertEqual([(1, date)], game_state.list_saves())
+
+    def test_only_matching_names_listed(self):
+        for name in ('save_3.dat', 'save_.dat', 'save_1a.dat', 'save_-1.dat', 'save_1.dat.bak', 'xsave_2.dat',
+                     'save_2.DAT', 'save_ 2.dat', 'save_2.txt'):
+            self._create_save(name)
+        self.assertEqual([3], [save_id for save_id, _ in game_state.list_saves()])
+
+
+if __name__ == '__main__':
+    unittest.main()
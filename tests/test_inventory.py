@@ -0,0 +1,75 @@
+import unittest
+
+from engine import inventory
+
+
+class ItemTestCase(unittest.TestCase):
+    def test_items_compare_by_id(self):
+        self.assertEqual(inventory.Item(1, inventory.Item.TYPE_NORMAL), inventory.Item(1, inventory.Item.TYPE_QUEST))
+        self.assertNotEqual(inventory.Item(1, inventory.Item.TYPE_NORMAL),
+                            inventory.Item(2, inventory.Item.TYPE_NORMAL))
+
+    def test_hash_ignores_type(self):
+        self.assertEqual(hash(inventory.Item(1, inventory.Item.TYPE_NORMAL)),
+                         hash(inventory.Item(1, inventory.Item.TYPE_EQUIP)))
+
+    def test_items_are_immutable(self):
+        item = inventory.Item(1, inventory.Item.TYPE_NORMAL)
+        with self.assertRaises(AttributeError):
+            item.id = 2
+
+
+class PlayerInventoryTestCase(unittest.TestCase):
+    def setUp(self):
+        self.inventory = inventory.PlayerInventory()
+        self.item = inventory.Item(1, inventory.Item.TYPE_NORMAL)
+
+    def _stacks(self, item_type: str = inventory.Item.TYPE_NORMAL) -> dict[inventory.Item, inventory.ItemStack]:
+        return self.inventory._items[item_type]
+
+    def test_add_new_item(self):
+        stack = inventory.ItemStack(self.item, 3)
+        self.inventory.add_item(stack)
+        self.assertEqual({self.item: inventory.ItemStack(self.item, 3)}, self._stacks())
+        # The inventory keeps its own copy of the stack
+        self.assertIsNot(stack, self._stacks()[self.item])
+
+    def test_add_merges_stacks_of_same_item(self):
+        self.inventory.add_item(inventory.ItemStack(self.item, 3))
+        self.inventory.add_item(inventory.ItemStack(inventory.Item(1, inventory.Item.TYPE_NORMAL), 4))
+        self.assertEqual(1, len(self._stacks()))
+        self.assertEqual(7, self._stacks()[self.item].count)
+
+    def test_add_items_are_stored_by_type(self):
+        quest_item = inventory.Item(2, inventory.Item.TYPE_QUEST)
+        self.inventory.add_item(inventory.ItemStack(self.item, 1))
+        self.inventory.add_item(inventory.ItemStack(quest_item, 1))
+        self.assertEqual([self.item], list(self._stacks()))
+        self.assertEqual([quest_item], list(self._stacks(inventory.Item.TYPE_QUEST)))
+
+    def test_add_over_max_count(self):
+        self.inventory.add_item(inventory.ItemStack(self.item, inventory.ItemStack.MAX_COUNT - 1))
+        self.inventory.add_item(inventory.ItemStack(self.item, 5))
+        self.assertEqual(inventory.ItemStack.MAX_COUNT, self._stacks()[self.item].count)
+
+    def test_add_empty_stack(self):
+        self.inventory.add_item(inventory.ItemStack(self.item, 0))
+        self.assertEqual({}, self._stacks())
+
+    def test_remove_some(self):
+        self.inventory.add_item(inventory.ItemStack(self.item, 5))
+        self.inventory.remove_item(inventory.ItemStack(self.item, 2))
+        self.assertEqual(3, self._stacks()[self.item].count)
+
+    def test_remove_all_deletes_stack(self):
+        self.inventory.add_item(inventory.ItemStack(self.item, 5))
+        self.inventory.remove_item(inventory.ItemStack(self.item, 8))
+        self.assertNotIn(self.item, self._stacks())
+
+    def test_remove_missing_item(self):
+        self.inventory.remove_item(inventory.ItemStack(self.item, 1))
+        self.assertEqual({}, self._stacks())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import types
+import unittest
+
+import pygame
+
+from engine import constants, io
+from engine.level import _level, interactions as inter
+
+
+def _write_change_level(buffer: io.ByteBuffer, destination_map: str, x: int, y: int, state: int):
+    inter.ChangeLevelInteraction(destination_map, pygame.Vector2(x, y), state, False).write_to_buffer(buffer)
+
+
+class LevelLoaderInteractionsTestCase(unittest.TestCase):
+    def setUp(self):
+        # Interactions loading does not need the levels data
+        self.loader = _level.LevelLoader.__new__(_level.LevelLoader)
+
+    def _load(self, buffer: io.ByteBuffer, width: int, height: int) -> list[list[inter.TileInteraction]]:
+        return self.loader._load_interactions(io.ByteBuffer(buffer.bytes), width, height)
+
+    def test_identical_interactions_are_shared(self):
+        buffer = io.ByteBuffer()
+        for _ in range(2):
+            _write_change_level(buffer, 'map', 1, 2, inter.ChangeLevelInteraction.LOCKED)
+            inter.HurtEntityInteraction(1.5).write_to_buffer(buffer)
+        rows = self._load(buffer, 2, 2)
+        self.assertIs(rows[0][0], rows[1][0])
+        self.assertIs(rows[0][1], rows[1][1])
+
+    def test_different_interactions_are_not_shared(self):
+        buffer = io.ByteBuffer()
+        _write_change_level(buffer, 'map', 1, 2, inter.ChangeLevelInteraction.OPEN)
+        _write_change_level(buffer, 'map', 1, 2, inter.ChangeLevelInteraction.LOCKED)
+        _write_change_level(buffer, 'map', 1, 3, inter.ChangeLevelInteraction.OPEN)
+        _write_change_level(buffer, 'other', 1, 2, inter.ChangeLevelInteraction.OPEN)
+        row = self._load(buffer, 4, 1)[0]
+        self.assertEqual(4, len({id(i) for i in row}))
+        self.assertTrue(row[0].is_open)
+        self.assertTrue(row[1].is_locked)
+        self.assertEqual(pygame.Vector2(1, 3), row[2].player_spawn_location)
+        self.assertEqual('other', row[3].destination_map)
+
+    def test_constant_interactions(self):
+        buffer = io.ByteBuffer()
+        inter.NO_INTERACTION.write_to_buffer(buffer)
+        inter.WALL_INTERACTION.write_to_buffer(buffer)
+        row = self._load(buffer, 2, 1)[0]
+        self.assertIs(inter.NO_INTERACTION, row[0])
+        self.assertIs(inter.WALL_INTERACTION, row[1])
+
+
+
+class LevelCameraTestCase(unittest.TestCase):
+    def _camera_position(self, map_size: tuple[int, int], window_size: tuple[int, int],
+                         player_pos: tuple[float, float]) -> tuple[float, float]:
+        # Only the camera state is needed, skip textures and entities initialization
+        level = _level.Level.__new__(_level.Level)
+        level._width, level._height = map_size
+        level._game_engine = types.SimpleNamespace(window_size=window_size)
+        level._player = types.SimpleNamespace(position=pygame.Vector2(player_pos))
+        level._update_camera_position()
+        return level._camera_x, level._camera_y
+
+    def test_camera_follows_player_on_large_map(self):
+        ts = constants.SCREEN_TILE_SIZE
+        self.assertEqual((10.5 * ts - 400, 20.5 * ts - 300), self._camera_position((100, 100), (800, 600), (10, 20)))
+
+    def test_small_map_is_centered(self):
+        ts = constants.SCREEN_TILE_SIZE
+        self.assertEqual(((4 * ts - 800) / 2, (3 * ts - 600) / 2), self._camera_position((4, 3), (800, 600), (1, 1)))
+
+    def test_axes_are_independent(self):
+        ts = constants.SCREEN_TILE_SIZE
+        self.assertEqual((10.5 * ts - 400, (3 * ts - 600) / 2), self._camera_position((100, 3), (800, 600), (10, 1)))
+
+
+if __name__ == '__main__':
+    unittest.main()